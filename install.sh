@@ -101,7 +101,6 @@ PACKAGES=(
     python3-spidev
     python3-lgpio
     fonts-dejavu-core
-    wireless-tools    # provides iwgetid, iwconfig
 )
 
 sudo apt-get update -qq
@@ -1,5 +1,6 @@
 """Button and joystick input handler using lgpio."""
 
+import queue
 import time
 
 import lgpio
@@ -20,22 +21,46 @@ DEBOUNCE_MS = 200
 
 
 class InputHandler:
-    """Read button and joystick events with debouncing."""
+    """Deliver debounced button and joystick events from GPIO edge alerts.
+
+    Buttons are claimed as falling-edge alerts rather than polled inputs, so
+    idle operation costs zero GPIO syscalls: lgpio's notification thread
+    pushes events into a queue and the main loop just blocks on it.
+    """
 
     def __init__(self, gpio_handle: int) -> None:
         self._gpio = gpio_handle
-        self._last_event_time: dict[str, float] = {}
+        self._events: queue.Queue[str] = queue.Queue()
+        self._names = {pin: name for name, pin in PINS.items()}
+        self._last_event_time: dict[int, float] = {}
+        self._callbacks = []
 
         for name, pin in PINS.items():
-            lgpio.gpio_claim_input(self._gpio, pin, lgpio.SET_PULL_UP)
-            self._last_event_time[name] = 0.0
+            lgpio.gpio_claim_alert(
+                self._gpio, pin, lgpio.FALLING_EDGE, lgpio.SET_PULL_UP
+            )
+            self._last_event_time[pin] = 0.0
+            self._callbacks.append(
+                lgpio.callback(self._gpio, pin, lgpio.FALLING_EDGE, self._on_edge)
+            )
 
-    def poll(self) -> str | None:
-        """Return the name of a pressed button, or None."""
+    def _on_edge(self, chip: int, gpio: int, level: int, tick: int) -> None:
+        """Alert callback — runs on lgpio's notification thread."""
         now = time.monotonic()
-        for name, pin in PINS.items():
-            if lgpio.gpio_read(self._gpio, pin) == 0:
-                if (now - self._last_event_time[name]) > (DEBOUNCE_MS / 1000):
-                    self._last_event_time[name] = now
-                    return name
-        return None
+        if (now - self._last_event_time[gpio]) > (DEBOUNCE_MS / 1000):
+            self._last_event_time[gpio] = now
+            self._events.put(self._names[gpio])
+
+    def poll(self) -> str | None:
+        """Return a pending button event, or None."""
+        try:
+            return self._events.get_nowait()
+        except queue.Empty:
+            return None
+
+    def wait(self, timeout: float) -> str | None:
+        """Block up to ``timeout`` seconds for a button event."""
+        try:
+            return self._events.get(timeout=max(timeout, 0))
+        except queue.Empty:
+            return None
@@ -17,7 +17,6 @@ log = logging.getLogger("pi-lcd-stats")
 SCREENS = [CpuStatsScreen(), NetworkScreen(), ResourcesScreen()]
 TOTAL = len(SCREENS)
 REFRESH_INTERVAL = 2.0  # seconds between data refresh
-POLL_SLEEP = 0.1  # seconds between input polls
 DEMO_PAGE_INTERVAL = 4.0  # seconds per page in demo auto-cycle
 
 
@@ -32,8 +31,15 @@ def main() -> None:
         _network_mod.DEMO_MODE = True
         log.info("Demo mode enabled — auto-cycling with fake network data.")
 
+    spi_hz = None
+    if "--spi-hz" in sys.argv:
+        try:
+            spi_hz = int(sys.argv[sys.argv.index("--spi-hz") + 1])
+        except (IndexError, ValueError):
+            log.warning("--spi-hz needs an integer argument — using default.")
+
     try:
-        display = Display()
+        display = Display(spi_hz=spi_hz) if spi_hz else Display()
     except DisplayNotFoundError as e:
         log.info("LCD HAT not detected (%s) — exiting.", e)
         sys.exit(0)
@@ -57,7 +63,13 @@ def main() -> None:
 
     try:
         while running:
-            event = inp.poll()
+            # Block on the input queue until a button arrives or the next
+            # refresh (or demo auto-advance) is due — no polling.
+            now = time.monotonic()
+            deadline = last_refresh + REFRESH_INTERVAL
+            if demo_mode:
+                deadline = min(deadline, last_auto_advance + DEMO_PAGE_INTERVAL)
+            event = inp.wait(deadline - now)
             if event == "RIGHT":
                 screen_idx = (screen_idx + 1) % TOTAL
                 page_idx = 0
@@ -116,8 +128,6 @@ def main() -> None:
                 img = screen.render(screen_idx, TOTAL, page_idx)
                 display.show(img)
 
-            time.sleep(POLL_SLEEP)
-
     finally:
         display.close()
 
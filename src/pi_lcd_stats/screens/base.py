@@ -1,7 +1,10 @@
 """Base screen class with common drawing helpers."""
 
-from collections import deque
+import time
+from collections.abc import Callable
+from functools import lru_cache
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 WIDTH = 128
@@ -25,22 +28,65 @@ FONT_LG = _load_font(12, bold=True)
 FONT_HEADER = _load_font(11, bold=True)
 FONT_XS = _load_font(9)
 
+# (ok, bad) status colors, indexed by a boolean condition — no per-frame
+# tuple literals or branches at draw time.
+BINARY_STATUS = ((0, 200, 120), (255, 60, 60))
+
+# color_for_percent as a 101-entry lookup built once at import
+_PCT_COLORS = tuple(
+    (0, 200, 120) if p < 50 else (255, 200, 0) if p < 80 else (255, 60, 60)
+    for p in range(101)
+)
+
+
+@lru_cache(maxsize=512)
+def _text_tile(
+    text: str, font: ImageFont.FreeTypeFont
+) -> tuple[Image.Image, tuple[int, int]] | None:
+    """Pre-rendered glyph mask and offset for a text/font pair.
+
+    Rasterizing is the expensive half of ImageDraw.text; labels repeat
+    every frame and values repeat whenever a reading holds steady, so the
+    mask is rendered once and stamped with draw.bitmap thereafter. The
+    fill color is applied at stamp time, so one tile serves any color.
+    """
+    if not text:
+        return None
+    mask, offset = font.getmask2(text, mode="L")
+    tile = Image.frombytes("L", mask.size, bytes(mask))
+    return tile, offset
+
+
+@lru_cache(maxsize=512)
+def _text_width(text: str, font: ImageFont.FreeTypeFont) -> float:
+    return font.getlength(text)
+
 
 class History:
     """Fixed-size ring buffer for sparkline data."""
 
+    __slots__ = ("_buf", "_pos", "_count")
+
     def __init__(self, maxlen: int = 60) -> None:
-        self._data: deque[float] = deque(maxlen=maxlen)
+        self._buf = np.zeros(maxlen, dtype=np.float32)
+        self._pos = 0
+        self._count = 0
 
     def push(self, value: float) -> None:
-        self._data.append(value)
+        self._buf[self._pos] = value
+        self._pos = (self._pos + 1) % len(self._buf)
+        if self._count < len(self._buf):
+            self._count += 1
 
     @property
-    def values(self) -> list[float]:
-        return list(self._data)
+    def values(self) -> np.ndarray:
+        """Samples in insertion order, oldest first."""
+        if self._count < len(self._buf):
+            return self._buf[: self._count]
+        return np.roll(self._buf, -self._pos)
 
     def __len__(self) -> int:
-        return len(self._data)
+        return self._count
 
 
 class BaseScreen:
@@ -50,6 +96,42 @@ class BaseScreen:
     header_color: tuple[int, int, int] = (65, 105, 225)
     page_count: int = 1
 
+    # Slotted instances: no per-screen __dict__, and attribute loads in the
+    # draw path skip the dict lookup. Subclasses list their own state.
+    __slots__ = ("_bg_cache", "_title_tw", "_header_img", "_ttl_cache")
+
+    def __init__(self) -> None:
+        # Prebaked static chrome (title bar, dots, pips), keyed by
+        # (screen_index, total_screens, page).
+        self._bg_cache: dict[tuple[int, int, int], Image.Image] = {}
+        # The title never changes, so measure its glyphs once instead of
+        # re-walking FreeType metrics on every background build.
+        self._title_tw = FONT_HEADER.getlength(self.title)
+        # Prebaked title bar, shared by every page's background. The strip is
+        # taller than the 15 px bar so glyph descenders render onto the
+        # regular background color instead of being clipped.
+        self._header_img = Image.new("RGB", (WIDTH, 20), BG_COLOR)
+        hdr = ImageDraw.Draw(self._header_img)
+        hdr.rectangle([(0, 0), (WIDTH, 14)], fill=self.header_color)
+        tx = (WIDTH - self._title_tw) // 2
+        hdr.text((tx, 1), self.title, fill=(255, 255, 255), font=FONT_HEADER)
+        # TTL cache for collectors whose values barely change between frames
+        self._ttl_cache: dict[str, tuple[float, object]] = {}
+
+    def _cached(self, key: str, ttl: float, fn: Callable):
+        """Return ``fn()``, reusing a previous result for ``ttl`` seconds.
+
+        Hostname, MAC, gateway and the like change on the timescale of
+        reboots, not refreshes — no point re-collecting them every 2 s.
+        """
+        now = time.monotonic()
+        hit = self._ttl_cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+        value = fn()
+        self._ttl_cache[key] = (now, value)
+        return value
+
     def render(
         self,
         screen_index: int,
@@ -57,17 +139,31 @@ class BaseScreen:
         page: int = 0,
     ) -> Image.Image:
         """Render the screen and return a PIL Image."""
+        key = (screen_index, total_screens, page)
+        bg = self._bg_cache.get(key)
+        if bg is None:
+            bg = self._build_background(screen_index, total_screens, page)
+            self._bg_cache[key] = bg
+
+        # Only the dynamic content is drawn per frame; the chrome comes from
+        # the cached background. The fresh ctx dict lets pages share sampled
+        # values within this one render.
+        img = bg.copy()
+        self.draw(ImageDraw.Draw(img), page, {})
+        return img
+
+    def _build_background(
+        self,
+        screen_index: int,
+        total_screens: int,
+        page: int,
+    ) -> Image.Image:
+        """Render the static chrome once for a given (screen, page)."""
         img = Image.new("RGB", (WIDTH, HEIGHT), BG_COLOR)
         draw = ImageDraw.Draw(img)
 
-        # Title bar
-        draw.rectangle([(0, 0), (WIDTH, 14)], fill=self.header_color)
-        tw = draw.textlength(self.title, font=FONT_HEADER)
-        tx = (WIDTH - tw) // 2
-        draw.text((tx, 1), self.title, fill=(255, 255, 255), font=FONT_HEADER)
-
-        # Draw screen content for the current page
-        self.draw(draw, page)
+        # Title bar (prebaked once per screen)
+        img.paste(self._header_img, (0, 0))
 
         # Screen indicator dots (bottom center)
         self._draw_dots(draw, screen_index, total_screens)
@@ -78,8 +174,17 @@ class BaseScreen:
 
         return img
 
-    def draw(self, draw: ImageDraw.ImageDraw, page: int = 0) -> None:
-        """Override to draw screen content. Content area starts at y=18."""
+    def draw(
+        self,
+        draw: ImageDraw.ImageDraw,
+        page: int = 0,
+        ctx: dict | None = None,
+    ) -> None:
+        """Override to draw screen content. Content area starts at y=18.
+
+        ``ctx`` is a per-render scratch dict: sampling helpers store values
+        there so pages sharing a metric don't sample it twice in one render.
+        """
         raise NotImplementedError
 
     @staticmethod
@@ -91,14 +196,16 @@ class BaseScreen:
         label_color: tuple[int, int, int] = (150, 150, 170),
         value_color: tuple[int, int, int] = (255, 255, 255),
     ) -> None:
-        """Draw a label: value pair."""
-        draw.text((4, y), label, fill=label_color, font=FONT_SM)
-        draw.text(
-            (4 + draw.textlength(label, font=FONT_SM) + 3, y),
-            value,
-            fill=value_color,
-            font=FONT_SM,
-        )
+        """Draw a label: value pair from cached glyph tiles."""
+        tiled = _text_tile(label, FONT_SM)
+        if tiled is not None:
+            tile, (dx, dy) = tiled
+            draw.bitmap((4 + dx, y + dy), tile, fill=label_color)
+        tiled = _text_tile(value, FONT_SM)
+        if tiled is not None:
+            vx = 4 + _text_width(label, FONT_SM) + 3
+            tile, (dx, dy) = tiled
+            draw.bitmap((vx + dx, y + dy), tile, fill=value_color)
 
     @staticmethod
     def draw_progress_bar(
@@ -129,7 +236,7 @@ class BaseScreen:
         y: int,
         width: int,
         height: int,
-        values: list[float],
+        values: np.ndarray,
         min_val: float = 0,
         max_val: float = 100,
         line_color: tuple[int, int, int] = (0, 200, 120),
@@ -139,24 +246,23 @@ class BaseScreen:
         # Background
         draw.rectangle([(x, y), (x + width, y + height)], fill=bg_color)
 
-        if len(values) < 2:
+        n = len(values)
+        if n < 2:
             return
 
         val_range = max_val - min_val
         if val_range == 0:
             val_range = 1
 
-        points = []
-        n = len(values)
-        for i, v in enumerate(values):
-            px = x + int(i * width / (n - 1))
-            clamped = max(min_val, min(v, max_val))
-            py = y + height - int((clamped - min_val) / val_range * height)
-            points.append((px, py))
+        # Vectorized point computation instead of a per-sample Python loop
+        values = np.asarray(values, dtype=np.float32)
+        xs = x + np.arange(n) * width // (n - 1)
+        clamped = np.clip(values, min_val, max_val)
+        ys = y + height - ((clamped - min_val) / val_range * height).astype(np.int32)
+        points = list(zip(xs.tolist(), ys.tolist()))
 
-        # Draw line segments
-        for i in range(len(points) - 1):
-            draw.line([points[i], points[i + 1]], fill=line_color, width=1)
+        # One polyline call draws every segment in a single C pass
+        draw.line(points, fill=line_color, width=1)
 
     @staticmethod
     def _draw_dots(draw: ImageDraw.ImageDraw, current: int, total: int) -> None:
@@ -189,11 +295,7 @@ class BaseScreen:
     @staticmethod
     def color_for_percent(percent: float) -> tuple[int, int, int]:
         """Return green/yellow/red based on percentage."""
-        if percent < 50:
-            return (0, 200, 120)
-        if percent < 80:
-            return (255, 200, 0)
-        return (255, 60, 60)
+        return _PCT_COLORS[max(0, min(int(percent), 100))]
 
     @staticmethod
     def temp_color(temp: float) -> tuple[int, int, int]:
@@ -0,0 +1,84 @@
+"""Background collector thread with tiered refresh intervals."""
+
+import heapq
+import threading
+import time
+from collections.abc import Callable
+
+
+class Collector(threading.Thread):
+    """Refresh slow metric collectors off the render path.
+
+    Each task has its own interval, scheduled on a deadline heap; results
+    land in a lock-guarded snapshot dict that draw() reads without ever
+    blocking on a collector. A slow read (a stalled /proc walk, a hung
+    ioctl) can then no longer stall the LCD refresh.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(name="collector", daemon=True)
+        self._lock = threading.Lock()
+        self._snapshot: dict[str, object] = {}
+        self._tasks: list[tuple[float, int, float, str, Callable]] = []
+        self._seq = 0
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+
+    def add_task(self, key: str, interval: float, fn: Callable) -> None:
+        """Refresh ``snapshot[key] = fn()`` every ``interval`` seconds."""
+        with self._lock:
+            heapq.heappush(self._tasks, (0.0, self._seq, interval, key, fn))
+            self._seq += 1
+        self._wake.set()
+
+    def get(self, key: str, default=None):
+        """Latest collected value for ``key`` (never blocks on collection)."""
+        with self._lock:
+            return self._snapshot.get(key, default)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            now = time.monotonic()
+            task = None
+            with self._lock:
+                if self._tasks and self._tasks[0][0] <= now:
+                    task = heapq.heappop(self._tasks)
+                    wait = 0.0
+                elif self._tasks:
+                    wait = self._tasks[0][0] - now
+                else:
+                    wait = 1.0
+
+            if task is None:
+                self._wake.wait(timeout=wait)
+                self._wake.clear()
+                continue
+
+            _, seq, interval, key, fn = task
+            try:
+                value = fn()
+            except Exception:
+                value = None
+            with self._lock:
+                if value is not None:
+                    self._snapshot[key] = value
+                heapq.heappush(
+                    self._tasks,
+                    (time.monotonic() + interval, seq, interval, key, fn),
+                )
+
+
+_collector: Collector | None = None
+
+
+def get_collector() -> Collector:
+    """Shared collector instance, started on first use."""
+    global _collector
+    if _collector is None:
+        _collector = Collector()
+        _collector.start()
+    return _collector
@@ -1,6 +1,7 @@
 """Screen 1: CPU temperature, voltage, frequency, usage (3 pages)."""
 
 import subprocess
+import time
 
 import psutil
 from PIL import ImageDraw
@@ -19,37 +20,60 @@ _THROTTLE_FLAGS = {
     19: ("Soft limit (boot)", (180, 130, 60)),
 }
 
+# (mask, label, color) iteration tables, precomputed from the flag dict
+_CURRENT_BITS = [(1 << b, *_THROTTLE_FLAGS[b]) for b in range(4)]
+_BOOT_BITS = [(1 << b, *_THROTTLE_FLAGS[b]) for b in range(16, 20)]
+
+# How long a vcgencmd result stays fresh. Each invocation is a fork+exec
+# (~5-10 ms on a Pi Zero), so results are shared between pages within one
+# refresh cycle.
+_VCGENCMD_TTL = 1.5
+
 
 class CpuStatsScreen(BaseScreen):
     title = "CPU STATS"
     header_color = (65, 105, 225)  # Royal blue
     page_count = 3
 
+    __slots__ = ("_temp_history", "_cpu_history", "_vc_cache")
+
     def __init__(self) -> None:
+        super().__init__()
         self._temp_history = History(maxlen=60)
         self._cpu_history = History(maxlen=60)
+        self._vc_cache: dict[str, tuple[float, str]] = {}
 
     def _read_vcgencmd(self, arg: str) -> str:
+        now = time.monotonic()
+        cached = self._vc_cache.get(arg)
+        if cached is not None and now - cached[0] < _VCGENCMD_TTL:
+            return cached[1]
         try:
-            return subprocess.check_output(
+            raw = subprocess.check_output(
                 ["vcgencmd", arg], text=True, timeout=2
             ).strip()
         except (subprocess.SubprocessError, FileNotFoundError):
-            return ""
+            raw = ""
+        self._vc_cache[arg] = (now, raw)
+        return raw
 
     def _get_temp(self) -> float:
+        # sysfs is a plain file read (microseconds) vs a vcgencmd fork+exec
+        # (milliseconds); keep vcgencmd only as a fallback.
+        try:
+            with open("/sys/class/thermal/thermal_zone0/temp") as f:
+                return int(f.read()) / 1000
+        except (OSError, ValueError):
+            pass
         raw = self._read_vcgencmd("measure_temp")
         try:
-            return float(raw.split("=")[1].replace("'C", ""))
-        except (IndexError, ValueError):
+            return float(raw.partition("=")[2].rstrip("'C"))
+        except ValueError:
             return 0.0
 
     def _get_voltage(self) -> str:
         raw = self._read_vcgencmd("measure_volts")
-        try:
-            return raw.split("=")[1]
-        except IndexError:
-            return "N/A"
+        return raw.partition("=")[2] or "N/A"
 
     def _get_freq(self) -> int:
         """Return CPU frequency in MHz."""
@@ -64,8 +88,8 @@ class CpuStatsScreen(BaseScreen):
         raw = self._read_vcgencmd("get_throttled")
         # "throttled=0x0"
         try:
-            return int(raw.split("=")[1], 16)
-        except (IndexError, ValueError):
+            return int(raw.partition("=")[2], 16)
+        except ValueError:
             return -1
 
     def _get_governor(self) -> str:
@@ -75,20 +99,42 @@ class CpuStatsScreen(BaseScreen):
         except OSError:
             return "N/A"
 
-    def draw(self, draw: ImageDraw.ImageDraw, page: int = 0) -> None:
+    def _sample_temp(self, ctx: dict) -> float:
+        """Sample the temperature once per render, pushing to history."""
+        if "temp" not in ctx:
+            temp = self._get_temp()
+            self._temp_history.push(temp)
+            ctx["temp"] = temp
+        return ctx["temp"]
+
+    def _sample_cpu(self, ctx: dict) -> float:
+        """Sample CPU usage once per render, pushing to history."""
+        if "cpu_pct" not in ctx:
+            usage = psutil.cpu_percent(interval=0)
+            self._cpu_history.push(usage)
+            ctx["cpu_pct"] = usage
+        return ctx["cpu_pct"]
+
+    def draw(
+        self,
+        draw: ImageDraw.ImageDraw,
+        page: int = 0,
+        ctx: dict | None = None,
+    ) -> None:
+        if ctx is None:
+            ctx = {}
         if page == 0:
-            self._draw_stats(draw)
+            self._draw_stats(draw, ctx)
         elif page == 1:
             self._draw_throttle(draw)
         else:
-            self._draw_history(draw)
+            self._draw_history(draw, ctx)
 
-    def _draw_stats(self, draw: ImageDraw.ImageDraw) -> None:
+    def _draw_stats(self, draw: ImageDraw.ImageDraw, ctx: dict) -> None:
         """Page 1: Temperature, voltage, frequency, usage."""
         y = 18
 
-        temp = self._get_temp()
-        self._temp_history.push(temp)
+        temp = self._sample_temp(ctx)
         tc = self.temp_color(temp)
         draw.text((4, y), "TEMP", fill=(150, 150, 170), font=FONT_SM)
         draw.text((50, y), f"{temp:.1f}\u00b0C", fill=tc, font=FONT_LG)
@@ -106,8 +152,7 @@ class CpuStatsScreen(BaseScreen):
         )
         y += 14
 
-        usage = psutil.cpu_percent(interval=0)
-        self._cpu_history.push(usage)
+        usage = self._sample_cpu(ctx)
         uc = self.color_for_percent(usage)
         draw.text((4, y), "CPU", fill=(150, 150, 170), font=FONT_SM)
         draw.text((88, y), f"{usage:.0f}%", fill=uc, font=FONT_SM)
@@ -136,9 +181,8 @@ class CpuStatsScreen(BaseScreen):
             draw.text((4, y), "CURRENT", fill=(255, 200, 100), font=FONT_XS)
             y += 11
             has_current = False
-            for bit in range(4):
-                if throttled & (1 << bit):
-                    label, color = _THROTTLE_FLAGS[bit]
+            for mask, label, color in _CURRENT_BITS:
+                if throttled & mask:
                     draw.text((8, y), f"\u2022 {label}", fill=color, font=FONT_XS)
                     y += 10
                     has_current = True
@@ -150,9 +194,8 @@ class CpuStatsScreen(BaseScreen):
             draw.text((4, y), "SINCE BOOT", fill=(180, 160, 120), font=FONT_XS)
             y += 11
             has_boot = False
-            for bit in range(16, 20):
-                if throttled & (1 << bit):
-                    label, color = _THROTTLE_FLAGS[bit]
+            for mask, label, color in _BOOT_BITS:
+                if throttled & mask:
                     draw.text((8, y), f"\u2022 {label}", fill=color, font=FONT_XS)
                     y += 10
                     has_boot = True
@@ -163,13 +206,12 @@ class CpuStatsScreen(BaseScreen):
         gov = self._get_governor()
         self.draw_label_value(draw, 108, "GOV:", gov, value_color=(100, 180, 255))
 
-    def _draw_history(self, draw: ImageDraw.ImageDraw) -> None:
+    def _draw_history(self, draw: ImageDraw.ImageDraw, ctx: dict) -> None:
         """Page 3: Temperature and CPU sparkline graphs."""
         y = 18
 
         # Temperature sparkline
-        temp = self._get_temp()
-        self._temp_history.push(temp)
+        temp = self._sample_temp(ctx)
         tc = self.temp_color(temp)
         draw.text((4, y), "TEMP", fill=(150, 150, 170), font=FONT_XS)
         draw.text((80, y), f"{temp:.1f}\u00b0C", fill=tc, font=FONT_SM)
@@ -188,8 +230,7 @@ class CpuStatsScreen(BaseScreen):
         y += 34
 
         # CPU usage sparkline
-        usage = psutil.cpu_percent(interval=0)
-        self._cpu_history.push(usage)
+        usage = self._sample_cpu(ctx)
         uc = self.color_for_percent(usage)
         draw.text((4, y), "CPU", fill=(150, 150, 170), font=FONT_XS)
         draw.text((80, y), f"{usage:.0f}%", fill=uc, font=FONT_SM)
@@ -1,13 +1,152 @@
 """Screen 2: Network information (3 pages)."""
 
+import array
+import fcntl
 import socket
-import subprocess
+import struct
 import time as _time
 
-import psutil
 from PIL import ImageDraw
 
-from .base import BaseScreen, FONT_SM
+from .base import BINARY_STATUS, BaseScreen, FONT_SM
+from .collector import get_collector
+
+# Wireless-extension ioctls (linux/wireless.h). Direct ioctls replace the
+# iwgetid/iwconfig/iw subprocess forks, each of which cost a fork+exec plus
+# text parsing per page turn.
+_SIOCGIWFREQ = 0x8B05
+_SIOCGIWRATE = 0x8B21
+_SIOCGIWESSID = 0x8B1B
+
+# Interface ioctls (linux/sockios.h)
+_SIOCGIFADDR = 0x8915
+_SIOCGIFHWADDR = 0x8927
+
+# RTF_GATEWAY in /proc/net/route flags
+_RTF_GATEWAY = 0x2
+
+# Hostname changes take a reboot in practice; one uname() at import beats
+# one per identity-page frame.
+_HOSTNAME = socket.gethostname()
+
+_ioctl_sock: socket.socket | None = None
+
+
+def _sock() -> socket.socket:
+    """Lazily created datagram socket shared by all interface ioctls."""
+    global _ioctl_sock
+    if _ioctl_sock is None:
+        _ioctl_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    return _ioctl_sock
+
+
+def _if_ip(ifname: str) -> str:
+    """IPv4 address of ``ifname`` via SIOCGIFADDR; empty string if down.
+
+    One syscall, versus psutil.net_if_addrs building namedtuples for every
+    address of every interface just to pick this one field.
+    """
+    req = struct.pack("256s", ifname.encode()[:15])
+    try:
+        res = fcntl.ioctl(_sock().fileno(), _SIOCGIFADDR, req)
+    except OSError:
+        return ""
+    return socket.inet_ntoa(res[20:24])
+
+
+def _if_mac(ifname: str) -> str:
+    """Hardware address of ``ifname`` via SIOCGIFHWADDR; empty on failure."""
+    req = struct.pack("256s", ifname.encode()[:15])
+    try:
+        res = fcntl.ioctl(_sock().fileno(), _SIOCGIFHWADDR, req)
+    except OSError:
+        return ""
+    return "%02x:%02x:%02x:%02x:%02x:%02x" % tuple(res[18:24])
+
+
+def _iw_essid(ifname: str) -> str:
+    """Read the SSID via SIOCGIWESSID; empty string when not associated."""
+    essid = array.array("B", b"\0" * 32)
+    addr, _ = essid.buffer_info()
+    req = struct.pack("16sLHH4x", ifname.encode(), addr, len(essid), 0)
+    try:
+        fcntl.ioctl(_sock().fileno(), _SIOCGIWESSID, req)
+    except OSError:
+        return ""
+    return essid.tobytes().rstrip(b"\0").decode(errors="replace")
+
+
+def _iw_param(ifname: str, ioctl_no: int) -> int:
+    """Read an iw_param-shaped ioctl result (freq mantissa is handled by
+    the caller); returns 0 on failure."""
+    req = struct.pack("16s16x", ifname.encode())
+    try:
+        res = fcntl.ioctl(_sock().fileno(), ioctl_no, req)
+    except OSError:
+        return 0
+    return struct.unpack_from("i", res, 16)[0]
+
+
+def _iw_freq_hz(ifname: str) -> float:
+    """Channel frequency in Hz via SIOCGIWFREQ, or 0."""
+    req = struct.pack("16s16x", ifname.encode())
+    try:
+        res = fcntl.ioctl(_sock().fileno(), _SIOCGIWFREQ, req)
+    except OSError:
+        return 0.0
+    m, e = struct.unpack_from("ih", res, 16)
+    return m * 10.0**e
+
+
+def _read_net_dev() -> dict[str, tuple[int, int, int, int, int, int]]:
+    """Parse /proc/net/dev into {iface: (rx_bytes, tx_bytes, errin, errout,
+    dropin, dropout)}.
+
+    One read serves both the per-NIC rate math and the aggregate
+    error/drop totals, where the psutil calls each rescanned the file.
+    """
+    stats: dict[str, tuple[int, int, int, int, int, int]] = {}
+    try:
+        with open("/proc/net/dev", "rb") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return stats
+    for line in lines[2:]:  # two header lines
+        name, sep, rest = line.partition(b":")
+        if not sep:
+            continue
+        fields = rest.split()
+        try:
+            stats[name.strip().decode()] = (
+                int(fields[0]),  # rx bytes
+                int(fields[8]),  # tx bytes
+                int(fields[2]),  # rx errs
+                int(fields[10]),  # tx errs
+                int(fields[3]),  # rx drop
+                int(fields[11]),  # tx drop
+            )
+        except (IndexError, ValueError):
+            continue
+    return stats
+
+
+def _proc_wireless_row() -> list[bytes] | None:
+    """Split fields of the wlan0 row in /proc/net/wireless, or None.
+
+    A byte-level find locates the row without decoding the file or
+    iterating lines.
+    """
+    try:
+        with open("/proc/net/wireless", "rb") as f:
+            buf = f.read()
+    except OSError:
+        return None
+    i = buf.find(b"wlan0:")
+    if i < 0:
+        return None
+    j = buf.find(b"\n", i)
+    # Callers only read the quality/level columns (2 and 3)
+    return buf[i : j if j != -1 else None].split(None, 4)
 
 # Set True to hide real network details (for demo videos)
 DEMO_MODE = False
@@ -31,66 +170,70 @@ class NetworkScreen(BaseScreen):
     header_color = (0, 160, 100)  # Green
     page_count = 3
 
+    __slots__ = (
+        "_prev_io",
+        "_prev_time",
+        "_tx_rate",
+        "_rx_rate",
+        "_identity_rows",
+        "_collector",
+    )
+
     def __init__(self) -> None:
+        super().__init__()
         self._prev_io: tuple[int, int] | None = None
         self._prev_time: float = 0
         self._tx_rate: float = 0
         self._rx_rate: float = 0
+        # Static identity-page layout: (y, label, value color, getter).
+        # Built once so draws don't recreate label strings and color tuples.
+        self._identity_rows = (
+            (20, "HOST:", (180, 220, 255), self._get_host),
+            (34, "IP:", (0, 230, 180), self._get_ip),
+            (48, "SSID:", (255, 220, 100), self._get_ssid),
+            (62, "SIG:", (100, 200, 255), self._get_signal),
+        )
+        # Slow collectors refresh on the shared background thread so a
+        # stalled read can't hold up the render loop.
+        self._collector = get_collector()
+        self._collector.add_task("wifi_details", 5.0, self._get_wifi_details)
+        self._collector.add_task("conns", 2.0, self._conn_count)
+
+    def _get_host(self) -> str:
+        if DEMO_MODE:
+            return _DEMO["hostname"]
+        return _HOSTNAME
 
     def _get_ip(self) -> str:
         if DEMO_MODE:
             return _DEMO["ip"]
-        addrs = psutil.net_if_addrs()
         for iface in ("wlan0", "eth0"):
-            if iface in addrs:
-                for addr in addrs[iface]:
-                    if addr.family == socket.AF_INET:
-                        return addr.address
+            ip = _if_ip(iface)
+            if ip:
+                return ip
         return "No IP"
 
     def _get_mac(self) -> str:
         if DEMO_MODE:
             return _DEMO["mac"]
-        addrs = psutil.net_if_addrs()
-        if "wlan0" in addrs:
-            for addr in addrs["wlan0"]:
-                if addr.family == psutil.AF_LINK:
-                    return addr.address
-        return "N/A"
+        return _if_mac("wlan0") or "N/A"
 
     def _get_ssid(self) -> str:
         if DEMO_MODE:
             return _DEMO["ssid"]
-        try:
-            return (
-                subprocess.check_output(
-                    ["/usr/sbin/iwgetid", "-r"], text=True, timeout=2
-                ).strip()
-                or "N/A"
-            )
-        except (subprocess.SubprocessError, FileNotFoundError):
-            return "N/A"
+        return _iw_essid("wlan0") or "N/A"
 
     def _get_signal(self) -> str:
         if DEMO_MODE:
             return _DEMO["signal"]
-        try:
-            out = subprocess.check_output(
-                ["/usr/sbin/iwconfig", "wlan0"],
-                text=True,
-                timeout=2,
-                stderr=subprocess.DEVNULL,
-            )
-            for line in out.splitlines():
-                if "Signal level" in line:
-                    part = line.split("Signal level=")[1].split()[0]
-                    return f"{part} dBm"
-        except (subprocess.SubprocessError, FileNotFoundError, IndexError):
-            pass
-        return "N/A"
+        # Column 4 of the wlan0 row is the signal level in dBm
+        row = _proc_wireless_row()
+        if row is None or len(row) < 4:
+            return "N/A"
+        return row[3].rstrip(b".").decode() + " dBm"
 
     def _get_wifi_details(self) -> dict[str, str]:
-        """Parse iw for channel, bitrate, link quality."""
+        """Channel/bitrate via wireless ioctls, link quality from /proc."""
         if DEMO_MODE:
             return {
                 "channel": _DEMO["channel"],
@@ -102,49 +245,35 @@ class NetworkScreen(BaseScreen):
             "bitrate": "N/A",
             "quality": "N/A",
         }
-        try:
-            out = subprocess.check_output(
-                ["iw", "dev", "wlan0", "link"],
-                text=True,
-                timeout=2,
-                stderr=subprocess.DEVNULL,
-            )
-            for line in out.splitlines():
-                line = line.strip()
-                if line.startswith("freq:"):
-                    info["channel"] = line.split("freq:")[1].strip() + " MHz"
-                elif "tx bitrate:" in line:
-                    info["bitrate"] = line.split("tx bitrate:")[1].strip()
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pass
+        freq_hz = _iw_freq_hz("wlan0")
+        if freq_hz:
+            info["channel"] = f"{int(freq_hz / 1e6)} MHz"
+        rate = _iw_param("wlan0", _SIOCGIWRATE)
+        if rate:
+            info["bitrate"] = f"{rate / 1e6:.1f} MBit/s"
 
         # Link quality from /proc/net/wireless
-        try:
-            with open("/proc/net/wireless") as f:
-                for line in f:
-                    if "wlan0" in line:
-                        parts = line.split()
-                        info["quality"] = parts[2].rstrip(".")
-                        break
-        except OSError:
-            pass
+        row = _proc_wireless_row()
+        if row is not None and len(row) > 2:
+            info["quality"] = row[2].rstrip(b".").decode()
 
         return info
 
     def _get_gateway(self) -> str:
         if DEMO_MODE:
             return _DEMO["gateway"]
+        # Default route row in /proc/net/route: destination 00000000 with the
+        # gateway flag set; the gateway column is little-endian hex.
         try:
-            out = subprocess.check_output(
-                ["ip", "route", "show", "default"],
-                text=True,
-                timeout=2,
-            )
-            # "default via 192.168.0.1 dev wlan0 ..."
-            parts = out.strip().split()
-            if len(parts) >= 3 and parts[0] == "default":
-                return parts[2]
-        except (subprocess.SubprocessError, FileNotFoundError):
+            with open("/proc/net/route") as f:
+                next(f)  # header
+                for line in f:
+                    # Only columns 1-3 matter; a bounded split skips
+                    # tokenizing the metric/mask/MTU tail of each row
+                    parts = line.split(None, 4)
+                    if parts[1] == "00000000" and int(parts[3], 16) & _RTF_GATEWAY:
+                        return socket.inet_ntoa(struct.pack("<I", int(parts[2], 16)))
+        except (OSError, IndexError, ValueError, StopIteration):
             pass
         return "N/A"
 
@@ -152,32 +281,64 @@ class NetworkScreen(BaseScreen):
         if DEMO_MODE:
             return _DEMO["dns"]
         try:
-            with open("/etc/resolv.conf") as f:
-                for line in f:
-                    if line.startswith("nameserver"):
-                        return line.split()[1]
-        except (OSError, IndexError):
-            pass
+            with open("/etc/resolv.conf", "rb") as f:
+                buf = f.read()
+        except OSError:
+            return "N/A"
+        # Find "nameserver" at a line start without decoding the whole file
+        i = buf.find(b"nameserver")
+        while i != -1:
+            if i == 0 or buf[i - 1] == 0x0A:
+                j = buf.find(b"\n", i)
+                parts = buf[i : j if j != -1 else None].split(None, 2)
+                if len(parts) > 1:
+                    return parts[1].decode()
+            i = buf.find(b"nameserver", i + 1)
         return "N/A"
 
-    def _update_rates(self) -> None:
-        """Compute TX/RX rates in KB/s."""
-        try:
-            io = psutil.net_io_counters(pernic=True).get("wlan0")
-            if io is None:
-                return
-        except (AttributeError, KeyError):
+    def _conn_count(self) -> int:
+        """Count inet sockets by line-counting the /proc/net tables.
+
+        psutil.net_connections walks every process's fd directory to map
+        sockets to owners — O(processes x fds) — but the display only shows
+        the total, which is just rows minus headers in these four files.
+        """
+        n = 0
+        for path in (
+            "/proc/net/tcp",
+            "/proc/net/tcp6",
+            "/proc/net/udp",
+            "/proc/net/udp6",
+        ):
+            try:
+                with open(path, "rb") as f:
+                    n += f.read().count(b"\n") - 1
+            except OSError:
+                continue
+        return n
+
+    def _update_rates(
+        self, stats: dict[str, tuple[int, int, int, int, int, int]]
+    ) -> None:
+        """Compute TX/RX rates in KB/s from a /proc/net/dev snapshot."""
+        io = stats.get("wlan0")
+        if io is None:
             return
 
         now = _time.monotonic()
         if self._prev_io is not None and (now - self._prev_time) > 0:
             dt = now - self._prev_time
-            self._tx_rate = (io.bytes_sent - self._prev_io[0]) / dt / 1024
-            self._rx_rate = (io.bytes_recv - self._prev_io[1]) / dt / 1024
-        self._prev_io = (io.bytes_sent, io.bytes_recv)
+            self._tx_rate = (io[1] - self._prev_io[0]) / dt / 1024
+            self._rx_rate = (io[0] - self._prev_io[1]) / dt / 1024
+        self._prev_io = (io[1], io[0])
         self._prev_time = now
 
-    def draw(self, draw: ImageDraw.ImageDraw, page: int = 0) -> None:
+    def draw(
+        self,
+        draw: ImageDraw.ImageDraw,
+        page: int = 0,
+        ctx: dict | None = None,
+    ) -> None:
         if page == 0:
             self._draw_identity(draw)
         elif page == 1:
@@ -187,69 +348,50 @@ class NetworkScreen(BaseScreen):
 
     def _draw_identity(self, draw: ImageDraw.ImageDraw) -> None:
         """Page 1: Hostname, IP, SSID, signal, MAC."""
-        y = 20
-
-        hostname = _DEMO["hostname"] if DEMO_MODE else socket.gethostname()
-        self.draw_label_value(draw, y, "HOST:", hostname, value_color=(180, 220, 255))
-        y += 14
-
-        ip = self._get_ip()
-        self.draw_label_value(draw, y, "IP:", ip, value_color=(0, 230, 180))
-        y += 14
-
-        ssid = self._get_ssid()
-        self.draw_label_value(draw, y, "SSID:", ssid, value_color=(255, 220, 100))
-        y += 14
-
-        signal = self._get_signal()
-        self.draw_label_value(draw, y, "SIG:", signal, value_color=(100, 200, 255))
-        y += 14
+        for y, label, color, getter in self._identity_rows:
+            self.draw_label_value(draw, y, label, getter(), value_color=color)
 
         mac = self._get_mac()
-        draw.text((4, y), "MAC:", fill=(150, 150, 170), font=FONT_SM)
-        y += 12
-        draw.text((4, y), mac, fill=(200, 200, 220), font=FONT_SM)
+        draw.text((4, 76), "MAC:", fill=(150, 150, 170), font=FONT_SM)
+        draw.text((4, 88), mac, fill=(200, 200, 220), font=FONT_SM)
 
     def _draw_traffic(self, draw: ImageDraw.ImageDraw) -> None:
         """Page 2: TX/RX rates, errors, connections."""
-        self._update_rates()
+        stats = _read_net_dev()
+        self._update_rates(stats)
         y = 18
 
+        # %-formatting beats f-strings for these hot, fixed-format rows
         draw.text(
             (4, y),
-            f"TX: {self._tx_rate:>7.1f} KB/s",
+            "TX: %7.1f KB/s" % self._tx_rate,
             fill=(100, 220, 180),
             font=FONT_SM,
         )
         y += 14
         draw.text(
             (4, y),
-            f"RX: {self._rx_rate:>7.1f} KB/s",
+            "RX: %7.1f KB/s" % self._rx_rate,
             fill=(100, 200, 255),
             font=FONT_SM,
         )
         y += 16
 
-        # Errors / drops
-        try:
-            io = psutil.net_io_counters()
-            errs = io.errin + io.errout
-            drops = io.dropin + io.dropout
-        except AttributeError:
-            errs = drops = 0
-
-        err_color = (255, 60, 60) if errs > 0 else (0, 200, 120)
-        drop_color = (255, 60, 60) if drops > 0 else (0, 200, 120)
+        # Errors / drops, summed across NICs from the same snapshot
+        errs = drops = 0
+        for _, _, errin, errout, dropin, dropout in stats.values():
+            errs += errin + errout
+            drops += dropin + dropout
+
+        err_color = BINARY_STATUS[errs > 0]
+        drop_color = BINARY_STATUS[drops > 0]
         self.draw_label_value(draw, y, "ERRORS:", str(errs), value_color=err_color)
         y += 13
         self.draw_label_value(draw, y, "DROPS:", str(drops), value_color=drop_color)
         y += 16
 
         # Connection count
-        try:
-            conns = len(psutil.net_connections(kind="inet"))
-        except (psutil.AccessDenied, OSError):
-            conns = 0
+        conns = self._collector.get("conns", 0)
         self.draw_label_value(
             draw, y, "CONNS:", str(conns), value_color=(180, 220, 255)
         )
@@ -258,7 +400,14 @@ class NetworkScreen(BaseScreen):
         """Page 3: Wi-Fi channel, bitrate, link quality, gateway, DNS."""
         y = 18
 
-        details = self._get_wifi_details()
+        if DEMO_MODE:
+            details = self._get_wifi_details()
+        else:
+            details = self._collector.get("wifi_details") or {
+                "channel": "N/A",
+                "bitrate": "N/A",
+                "quality": "N/A",
+            }
 
         self.draw_label_value(
             draw, y, "FREQ:", details["channel"], value_color=(100, 200, 255)
@@ -275,9 +424,9 @@ class NetworkScreen(BaseScreen):
         )
         y += 16
 
-        gw = self._get_gateway()
+        gw = self._cached("gateway", 30.0, self._get_gateway)
         self.draw_label_value(draw, y, "GW:", gw, value_color=(0, 230, 180))
         y += 13
 
-        dns = self._get_dns()
+        dns = self._cached("dns", 60.0, self._get_dns)
         self.draw_label_value(draw, y, "DNS:", dns, value_color=(0, 230, 180))
@@ -1,12 +1,19 @@
 """Screen 3: System resources (3 pages)."""
 
+import heapq
 import os
 import time as _time
 
 import psutil
 from PIL import ImageDraw
 
-from .base import BaseScreen, FONT_SM, FONT_XS
+from .base import BINARY_STATUS, BaseScreen, FONT_SM, FONT_XS
+from .collector import get_collector
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK")
+
+# (ok, elevated) colors for the dirty-pages row
+_DIRTY_STATUS = ((0, 200, 120), (255, 200, 0))
 
 
 class ResourcesScreen(BaseScreen):
@@ -14,21 +21,49 @@ class ResourcesScreen(BaseScreen):
     header_color = (220, 120, 0)  # Orange
     page_count = 3
 
+    __slots__ = (
+        "_prev_disk_io",
+        "_prev_disk_time",
+        "_read_rate",
+        "_write_rate",
+        "_prev_ticks",
+        "_prev_proc_time",
+        "_prev_cpu_totals",
+        "_uptime_fd",
+        "_gpu_arm",
+        "_collector",
+    )
+
     def __init__(self) -> None:
+        super().__init__()
         self._prev_disk_io: tuple[int, int] | None = None
         self._prev_disk_time: float = 0
         self._read_rate: float = 0
         self._write_rate: float = 0
+        self._prev_ticks: dict[int, int] = {}
+        self._prev_proc_time: float = 0
+        self._prev_cpu_totals: tuple[int, int] | None = None  # (total, iowait)
+        self._uptime_fd = -1  # opened lazily, reused via pread
+        # GPU/ARM memory split is fixed at boot; collected on first view
+        # of the memory page and kept for the life of the process.
+        self._gpu_arm: tuple[str, str] | None = None
+        # The /proc walk for top processes runs on the background collector
+        self._collector = get_collector()
+        self._collector.add_task("top_procs", 2.0, self._get_top_procs)
 
     def _get_uptime(self) -> str:
+        # pread on a kept-open fd skips the open() and TextIOWrapper setup
+        # per refresh; only the whole seconds before the dot are needed.
         try:
-            with open("/proc/uptime") as f:
-                seconds = float(f.read().split()[0])
+            if self._uptime_fd < 0:
+                self._uptime_fd = os.open("/proc/uptime", os.O_RDONLY)
+            buf = os.pread(self._uptime_fd, 32, 0)
+            seconds = int(buf[: buf.index(b".")])
         except (OSError, ValueError):
             return "N/A"
-        days = int(seconds // 86400)
-        hours = int((seconds % 86400) // 3600)
-        mins = int((seconds % 3600) // 60)
+        days = seconds // 86400
+        hours = (seconds % 86400) // 3600
+        mins = (seconds % 3600) // 60
         if days > 0:
             return f"{days}d {hours}h {mins}m"
         return f"{hours}h {mins}m"
@@ -47,28 +82,32 @@ class ResourcesScreen(BaseScreen):
             raw = subprocess.check_output(
                 ["vcgencmd", "get_mem", "gpu"], text=True, timeout=2
             ).strip()
-            gpu = raw.split("=")[1]
-        except (subprocess.SubprocessError, FileNotFoundError, IndexError):
+            gpu = raw.partition("=")[2] or "N/A"
+        except (subprocess.SubprocessError, FileNotFoundError):
             pass
         try:
             raw = subprocess.check_output(
                 ["vcgencmd", "get_mem", "arm"], text=True, timeout=2
             ).strip()
-            arm = raw.split("=")[1]
-        except (subprocess.SubprocessError, FileNotFoundError, IndexError):
+            arm = raw.partition("=")[2] or "N/A"
+        except (subprocess.SubprocessError, FileNotFoundError):
             pass
         return gpu, arm
 
-    def _get_meminfo_field(self, field: str) -> int:
-        """Return a /proc/meminfo field value in KB."""
+    def _read_meminfo(self) -> dict[str, int]:
+        """Parse /proc/meminfo once into {field: value in KB}."""
+        fields: dict[str, int] = {}
         try:
             with open("/proc/meminfo") as f:
                 for line in f:
-                    if line.startswith(field):
-                        return int(line.split()[1])
-        except (OSError, ValueError, IndexError):
+                    key, _, rest = line.partition(":")
+                    try:
+                        fields[key] = int(rest.split(None, 1)[0])
+                    except (ValueError, IndexError):
+                        continue
+        except OSError:
             pass
-        return 0
+        return fields
 
     def _update_disk_rates(self) -> None:
         """Compute disk read/write rates in KB/s."""
@@ -85,19 +124,88 @@ class ResourcesScreen(BaseScreen):
         self._prev_disk_io = (io.read_bytes, io.write_bytes)
         self._prev_disk_time = now
 
+    @staticmethod
+    def _count_procs() -> int:
+        """Count processes with one readdir of /proc.
+
+        psutil.pids() does the same listing but also int-converts and sorts
+        every entry into a list we'd only take the length of.
+        """
+        return sum(1 for entry in os.listdir("/proc") if entry.isdigit())
+
+    def _get_iowait(self) -> float:
+        """Return iowait percent from the aggregate /proc/stat line.
+
+        psutil.cpu_times_percent(interval=0) parses every per-CPU line and
+        diffs against module-global state shared with any other caller;
+        reading the first line and keeping our own previous snapshot gives
+        a consistent delta for the cost of one small read.
+        """
+        try:
+            with open("/proc/stat", "rb") as f:
+                fields = f.readline().split()
+            times = [int(v) for v in fields[1:8]]
+        except (OSError, ValueError, IndexError):
+            return 0.0
+        total = sum(times)
+        iowait = times[4]
+        prev = self._prev_cpu_totals
+        self._prev_cpu_totals = (total, iowait)
+        if prev is None or total <= prev[0]:
+            return 0.0
+        return (iowait - prev[1]) / (total - prev[0]) * 100
+
     def _get_top_procs(self, n: int = 4) -> list[tuple[str, float]]:
-        """Return top N processes by CPU percent."""
-        procs = []
-        for p in psutil.process_iter(["name", "cpu_percent"]):
+        """Return top N processes by CPU percent.
+
+        Reads /proc/[pid]/stat directly and computes utime+stime deltas
+        against the previous scan — one small read per PID instead of the
+        Process objects and multi-file reads psutil.process_iter does.
+        """
+        now = _time.monotonic()
+        dt = now - self._prev_proc_time
+        ticks: dict[int, int] = {}
+        usages: list[tuple[float, str]] = []
+
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
             try:
-                info = p.info
-                procs.append((info["name"] or "?", info["cpu_percent"] or 0.0))
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                with open(f"/proc/{entry}/stat", "rb") as f:
+                    data = f.read()
+            except OSError:
+                continue
+            # comm sits in parentheses and may itself contain spaces, so
+            # split only what follows the closing paren
+            rpar = data.rfind(b")")
+            if rpar < 0:
+                continue
+            name = data[data.find(b"(") + 1 : rpar].decode(errors="replace")
+            fields = data[rpar + 2 :].split()
+            try:
+                total = int(fields[11]) + int(fields[12])  # utime + stime
+            except (IndexError, ValueError):
                 continue
-        procs.sort(key=lambda x: x[1], reverse=True)
-        return procs[:n]
 
-    def draw(self, draw: ImageDraw.ImageDraw, page: int = 0) -> None:
+            pid = int(entry)
+            ticks[pid] = total
+            prev = self._prev_ticks.get(pid)
+            if prev is not None and dt > 0:
+                pct = (total - prev) / _CLK_TCK / dt * 100
+            else:
+                pct = 0.0
+            usages.append((pct, name))
+
+        self._prev_ticks = ticks
+        self._prev_proc_time = now
+        return [(name, pct) for pct, name in heapq.nlargest(n, usages)]
+
+    def draw(
+        self,
+        draw: ImageDraw.ImageDraw,
+        page: int = 0,
+        ctx: dict | None = None,
+    ) -> None:
         if page == 0:
             self._draw_overview(draw)
         elif page == 1:
@@ -119,7 +227,7 @@ class ResourcesScreen(BaseScreen):
         )
         y += 14
 
-        mem = psutil.virtual_memory()
+        mem = self._cached("vmem", 2.0, psutil.virtual_memory)
         mem_pct = mem.percent
         used_mb = mem.used // (1024 * 1024)
         total_mb = mem.total // (1024 * 1024)
@@ -130,7 +238,8 @@ class ResourcesScreen(BaseScreen):
         self.draw_progress_bar(draw, 4, y, 118, 6, mem_pct, fg_color=mc)
         y += 12
 
-        disk = psutil.disk_usage("/")
+        # Partition fill doesn't move perceptibly between frames
+        disk = self._cached("disk", 5.0, lambda: psutil.disk_usage("/"))
         disk_pct = disk.percent
         used_gb = disk.used / (1024**3)
         total_gb = disk.total / (1024**3)
@@ -141,13 +250,13 @@ class ResourcesScreen(BaseScreen):
         self.draw_progress_bar(draw, 4, y, 118, 6, disk_pct, fg_color=dc)
         y += 12
 
-        procs = len(psutil.pids())
+        procs = self._cached("nprocs", 2.0, self._count_procs)
         self.draw_label_value(
             draw, y, "PROCS:", str(procs), value_color=(180, 220, 255)
         )
         y += 14
 
-        uptime = self._get_uptime()
+        uptime = self._cached("uptime", 15.0, self._get_uptime)
         self.draw_label_value(draw, y, "UP:", uptime, value_color=(100, 255, 200))
 
     def _draw_memory(self, draw: ImageDraw.ImageDraw) -> None:
@@ -169,9 +278,12 @@ class ResourcesScreen(BaseScreen):
             )
             y += 14
 
+        # One meminfo scan covers all four fields below
+        meminfo = self._read_meminfo()
+
         # Buffers / Cache
-        buffers_kb = self._get_meminfo_field("Buffers:")
-        cached_kb = self._get_meminfo_field("Cached:")
+        buffers_kb = meminfo.get("Buffers", 0)
+        cached_kb = meminfo.get("Cached", 0)
         buffers_mb = buffers_kb // 1024
         cached_mb = cached_kb // 1024
         self.draw_label_value(
@@ -184,7 +296,7 @@ class ResourcesScreen(BaseScreen):
         y += 14
 
         # Available
-        avail_kb = self._get_meminfo_field("MemAvailable:")
+        avail_kb = meminfo.get("MemAvailable", 0)
         avail_mb = avail_kb // 1024
         self.draw_label_value(
             draw, y, "AVAIL:", f"{avail_mb}M", value_color=(0, 200, 120)
@@ -192,15 +304,17 @@ class ResourcesScreen(BaseScreen):
         y += 14
 
         # Dirty pages
-        dirty_kb = self._get_meminfo_field("Dirty:")
-        dirty_color = (255, 200, 0) if dirty_kb > 1024 else (0, 200, 120)
+        dirty_kb = meminfo.get("Dirty", 0)
+        dirty_color = _DIRTY_STATUS[dirty_kb > 1024]
         self.draw_label_value(
             draw, y, "DIRTY:", f"{dirty_kb}K", value_color=dirty_color
         )
         y += 16
 
-        # GPU / ARM split
-        gpu_mem, arm_mem = self._get_gpu_arm_mem()
+        # GPU / ARM split (static from boot — two vcgencmd forks, once ever)
+        if self._gpu_arm is None:
+            self._gpu_arm = self._get_gpu_arm_mem()
+        gpu_mem, arm_mem = self._gpu_arm
         self.draw_label_value(draw, y, "GPU:", gpu_mem, value_color=(180, 160, 255))
         y += 13
         self.draw_label_value(draw, y, "ARM:", arm_mem, value_color=(180, 160, 255))
@@ -215,24 +329,21 @@ class ResourcesScreen(BaseScreen):
         y += 11
         draw.text(
             (4, y),
-            f"R: {self._read_rate:>6.0f} KB/s",
+            "R: %6.0f KB/s" % self._read_rate,
             fill=(100, 200, 255),
             font=FONT_XS,
         )
         draw.text(
             (68, y),
-            f"W: {self._write_rate:>5.0f} KB/s",
+            "W: %5.0f KB/s" % self._write_rate,
             fill=(255, 180, 100),
             font=FONT_XS,
         )
         y += 11
 
         # iowait
-        try:
-            iowait = psutil.cpu_times_percent(interval=0).iowait
-        except AttributeError:
-            iowait = 0
-        iow_color = (255, 60, 60) if iowait > 10 else (0, 200, 120)
+        iowait = self._get_iowait()
+        iow_color = BINARY_STATUS[iowait > 10]
         self.draw_label_value(
             draw, y, "IOWAIT:", f"{iowait:.1f}%", value_color=iow_color
         )
@@ -242,7 +353,7 @@ class ResourcesScreen(BaseScreen):
         draw.text((4, y), "TOP PROCS", fill=(150, 150, 170), font=FONT_XS)
         y += 11
 
-        top = self._get_top_procs(4)
+        top = self._collector.get("top_procs") or []
         for name, cpu in top:
             truncated = name[:14]
             pc = self.color_for_percent(cpu)